@@ -1,5 +1,6 @@
 import os
 import sys
+import asyncio
 import discord.ext.commands as commands
 import discord
 import datetime as dt
@@ -45,9 +46,7 @@ class Debug(commands.Cog):
     @restricted()
     @gitbot_command(name='ratelimit', aliases=['rate'], hidden=True)
     async def ratelimit_command(self, ctx: GitBotContext) -> None:
-        data: list = []
-        for gh in self.bot._internal_github_instances:
-            data.append(await gh.get_ratelimit())
+        data: list = await asyncio.gather(*(gh.get_ratelimit() for gh in self.bot._internal_github_instances))
         embed: GitBotEmbed = GitBotEmbed(
             title=f'{self.bot.mgr.e.error}  Rate-limiting'
         )
@@ -46,7 +46,7 @@ async def silent_snippet_command(ctx: GitBotContext) -> Optional[discord.Message
             codeblock: Optional[str] = (await handle_url(ctx, ctx.message.content))[0]
             if codeblock:
                 ctx.bot.logger.debug('Converting MID %d into codeblock...', ctx.message.id)
-                return await ctx.reply(codeblock, mention_author=False, view=GitHubLinesView(ctx, ctx.message.content))
+                return await ctx.reply(codeblock, mention_author=False, view=GitHubLinesView(ctx, ctx.message.content, codeblock))
             else:
                 return await ctx.message.add_reaction('❌')  # only whitespace mentioned or something similar
     _1st_lineno: int = 1 if not match_ else match_.group('first_line_number')
@@ -209,15 +209,14 @@ class Repo(commands.Cog):
     async def download_command(self, ctx: GitBotContext, repo: GitHubRepository) -> None:
         ctx.fmt.set_prefix('repo download')
         msg: discord.Message = await ctx.send(f"{self.bot.mgr.e.github}  {ctx.l.repo.download.wait}")
-        src_bytes: Optional[bytes | bool] = await self.bot.github.get_repo_zip(repo)
-        if src_bytes is None:  # pylint: disable=no-else-return
+        src: Optional[io.BytesIO | bool] = await self.bot.github.get_repo_zip(repo)
+        if src is None:  # pylint: disable=no-else-return
             return await msg.edit(content=f"{self.bot.mgr.e.error}  {ctx.l.generic.nonexistent.repo.base}")
-        elif src_bytes is False:
+        elif src is False:
             return await msg.edit(
                     content=f"{self.bot.mgr.e.error}  {ctx.fmt('file_too_big', f'https://github.com/{repo}')}")
-        io_obj: io.BytesIO = io.BytesIO(src_bytes)
         try:
-            await ctx.send(file=discord.File(filename=f'{repo.replace("/", "-")}.zip', fp=io_obj))
+            await ctx.send(file=discord.File(filename=f'{repo.replace("/", "-")}.zip', fp=src))
             await msg.edit(content=f'{self.bot.mgr.e.checkmark}  {ctx.fmt("done", repo)}')
         except discord.errors.HTTPException:
             await msg.edit(
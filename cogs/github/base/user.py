@@ -1,7 +1,8 @@
+import asyncio
 import discord
 from discord.ext import commands
 from typing import Optional
-from lib.structs import GitBot, GitBotEmbed, SnakeCaseDictProxy
+from lib.structs import GitBot, GitBotEmbed, SnakeCaseDictProxy, DictProxy
 from lib.utils.decorators import gitbot_group
 from lib.typehints import GitHubUser
 from lib.structs.discord.context import GitBotContext
@@ -47,27 +48,28 @@ class User(commands.Cog):
             url=u['url']
         )
 
+        l_info: DictProxy = ctx.l.user.info
         contrib_count: Optional[tuple] = u['contributions']
         orgs_c: int = u['organizations_count']
         if "bio" in u and u['bio'] is not None and len(u['bio']) > 0:
-            embed.add_field(name=f":notepad_spiral: {ctx.l.user.info.glossary[0]}:", value=f"```{u['bio']}```")
-        occupation: str = (ctx.l.user.info.company + '\n').format(u['company']) if 'company' in u and u[
-            'company'] is not None else ctx.l.user.info.no_company + '\n'
-        orgs: str = (ctx.l.user.info.orgs.plural.format(orgs_c) if orgs_c != 0 else ctx.l.user.info.orgs.no_orgs) + '\n'
+            embed.add_field(name=f":notepad_spiral: {l_info.glossary[0]}:", value=f"```{u['bio']}```")
+        occupation: str = (l_info.company + '\n').format(u['company']) if 'company' in u and u[
+            'company'] is not None else l_info.no_company + '\n'
+        orgs: str = (l_info.orgs.plural.format(orgs_c) if orgs_c != 0 else l_info.orgs.no_orgs) + '\n'
         if orgs_c == 1:
-            orgs: str = f'{ctx.l.user.info.orgs.singular}\n'
-        followers: str = ctx.l.user.info.followers.no_followers if u[
+            orgs: str = f'{l_info.orgs.singular}\n'
+        followers: str = l_info.followers.no_followers if u[
                                                             'followers_count'] == 0 else ctx.fmt('followers plural', u['followers_count'], u['url'] + '?tab=followers')
 
         if u['followers_count'] == 1:
             followers: str = ctx.fmt('followers singular', u['url'] + '?tab=followers')
-        following: str = ctx.l.user.info.following.no_following if u[
+        following: str = l_info.following.no_following if u[
                                                              'following_count'] == 0 else ctx.fmt('following plural', u['following_count'], u['url'] + '?tab=following')
         if u['following_count'] == 1:
             following: str = ctx.fmt('following singular', f'{u["url"]}?tab=following')
-        follow: str = followers + f' {ctx.l.user.info.linking_word} ' + following
+        follow: str = followers + f' {l_info.linking_word} ' + following
 
-        repos: str = f"{ctx.l.user.info.repos.no_repos}\n" if u.repositories_count == 0 else ctx.fmt('repos plural', u.repositories_count, f"{u['url']}?tab=repositories") + '\n'
+        repos: str = f"{l_info.repos.no_repos}\n" if u.repositories_count == 0 else ctx.fmt('repos plural', u.repositories_count, f"{u['url']}?tab=repositories") + '\n'
         if u.repositories_count == 1:
             repos: str = ctx.fmt('repos singular', f"{u['url']}?tab=repositories") + '\n'
         if contrib_count is not None:
@@ -78,10 +80,10 @@ class User(commands.Cog):
         joined_at: str = ctx.fmt('joined_at', self.bot.mgr.github_to_discord_timestamp(u['createdAt'])) + '\n'
 
         info: str = f"{joined_at}{repos}{occupation}{orgs}{follow}{contrib}"
-        embed.add_field(name=f':mag_right: {ctx.l.user.info.glossary[1]}:', value=info, inline=False)
+        embed.add_field(name=f':mag_right: {l_info.glossary[1]}:', value=info, inline=False)
         w_url: str = u['websiteUrl']
         if w_url:
-            blog: tuple = (w_url if w_url.startswith(('https://', 'http://')) else f'https://{w_url}', ctx.l.user.info.glossary[3])
+            blog: tuple = (w_url if w_url.startswith(('https://', 'http://')) else f'https://{w_url}', l_info.glossary[3])
         else:
             blog: tuple = (None, ctx.l.glossary.website.capitalize())
         twitter: tuple = ((
@@ -92,7 +94,7 @@ class User(commands.Cog):
             if lnk[0] is not None and lnk[0] != '':
                 link_strings.append(f"- [{lnk[1]}]({lnk[0]})")
         if len(link_strings) != 0:
-            embed.add_field(name=f":link: {ctx.l.user.info.glossary[2]}:", value='\n'.join(link_strings), inline=False)
+            embed.add_field(name=f":link: {l_info.glossary[2]}:", value='\n'.join(link_strings), inline=False)
         embed.set_thumbnail(url=u['avatarUrl'])
         # for repo in u['pinnedItems']['nodes']:
         #     embed.add_field(name=f"{self.bot.mgr.e.github_repo} {repo['name']}",
@@ -108,8 +110,7 @@ class User(commands.Cog):
     @user_command_group.command(name='repos', aliases=['r'])
     async def user_repos_command(self, ctx: GitBotContext, user: GitHubUser) -> None:
         ctx.fmt.set_prefix('user repos')
-        u: Optional[dict] = await self.bot.github.get_user(user)
-        repos = await self.bot.github.get_user_repos(user)
+        u, repos = await asyncio.gather(self.bot.github.get_user(user), self.bot.github.get_user_repos(user))
         if u is None:
             await ctx.error(ctx.l.generic.nonexistent.user.base)
             return
@@ -1,26 +1,132 @@
 import os
-import os.path
-import json
-import aiofiles
-import shutil
+import re
+import asyncio
+import tempfile
 import fnmatch
-import subprocess
+import zipfile
+import itertools
 from discord.ext import commands
-from typing import Optional
+from typing import Optional, BinaryIO, Iterable
 from lib.structs import GitBotEmbed, GitBot
 from lib.utils.decorators import gitbot_command, normalize_repository
 from lib.typehints import GitHubRepository
 from lib.structs.discord.context import GitBotContext
 
 _25MB_BYTES: int = int(25 * (1024 ** 2))
+_4MB_BYTES: int = int(4 * (1024 ** 2))  # archives above this are spooled to disk while counting
+_256MB_BYTES: int = int(256 * (1024 ** 2))
+_MAX_FILE_SIZE_BYTES: int = _4MB_BYTES  # larger members are skipped, they're generated or data files in disguise
+_MAX_UNCOMPRESSED_SIZE_BYTES: int = _256MB_BYTES  # the archive is refused past this, so zip bombs can't exhaust memory
 
+# (language name, line comment prefixes, (opener, closer) pairs of block comments)
+_BlockDelimiters = tuple[tuple[bytes, bytes], ...]
+_LangRules = tuple[str, tuple[bytes, ...], _BlockDelimiters]
 
-class LinesOfCode(commands.Cog):
-    # I know that using "perl" alone is insecure, but it will only be used in Windows dev environments
-    __perl_command_line__: str = '/bin/perl' if os.name != 'nt' else 'perl'
+_C_LIKE: tuple[tuple[bytes, ...], _BlockDelimiters] = ((b'//',), ((b'/*', b'*/'),))
+_HASH: tuple[tuple[bytes, ...], _BlockDelimiters] = ((b'#',), ())
+# like CLOC, docstrings (and any other triple-quoted strings) are counted as comments
+_PYTHON: tuple[tuple[bytes, ...], _BlockDelimiters] = ((b'#',), ((b'"""', b'"""'), (b"'''", b"'''")))
+
+# Unlike CLOC, extensions are never disambiguated by content - .m is always Objective-C, .v is V and .pl is Perl
+_LANGUAGES_BY_EXTENSION: dict[str, _LangRules] = {
+    'c': ('C', *_C_LIKE), 'h': ('C/C++ Header', *_C_LIKE), 'hpp': ('C/C++ Header', *_C_LIKE),
+    'cpp': ('C++', *_C_LIKE), 'cc': ('C++', *_C_LIKE), 'cxx': ('C++', *_C_LIKE),
+    'cs': ('C#', *_C_LIKE), 'java': ('Java', *_C_LIKE), 'kt': ('Kotlin', *_C_LIKE), 'kts': ('Kotlin', *_C_LIKE),
+    'scala': ('Scala', *_C_LIKE), 'go': ('Go', *_C_LIKE), 'rs': ('Rust', *_C_LIKE), 'swift': ('Swift', *_C_LIKE),
+    'dart': ('Dart', *_C_LIKE), 'groovy': ('Groovy', *_C_LIKE), 'gradle': ('Gradle', *_C_LIKE),
+    'js': ('JavaScript', *_C_LIKE), 'mjs': ('JavaScript', *_C_LIKE), 'cjs': ('JavaScript', *_C_LIKE),
+    'jsx': ('JSX', *_C_LIKE), 'ts': ('TypeScript', *_C_LIKE), 'tsx': ('TypeScript', *_C_LIKE),
+    'php': ('PHP', (b'//', b'#'), ((b'/*', b'*/'),)), 'css': ('CSS', (), ((b'/*', b'*/'),)),
+    'scss': ('SCSS', *_C_LIKE), 'less': ('LESS', *_C_LIKE), 'sass': ('Sass', *_C_LIKE),
+    'm': ('Objective-C', *_C_LIKE), 'mm': ('Objective-C++', *_C_LIKE), 'zig': ('Zig', (b'//',), ()),
+    'sol': ('Solidity', *_C_LIKE), 'proto': ('Protocol Buffers', *_C_LIKE), 'v': ('V', *_C_LIKE),
+    'py': ('Python', *_PYTHON), 'pyx': ('Cython', *_PYTHON), 'rb': ('Ruby', *_HASH), 'pl': ('Perl', *_HASH),
+    'pm': ('Perl', *_HASH), 'sh': ('Bourne Shell', *_HASH), 'bash': ('Bourne Again Shell', *_HASH),
+    'zsh': ('zsh', *_HASH), 'fish': ('fish', *_HASH), 'ps1': ('PowerShell', (b'#',), ((b'<#', b'#>'),)),
+    'r': ('R', *_HASH), 'jl': ('Julia', (b'#',), ((b'#=', b'=#'),)), 'ex': ('Elixir', *_HASH),
+    'exs': ('Elixir Script', *_HASH), 'nim': ('Nim', *_HASH), 'cr': ('Crystal', *_HASH),
+    'yaml': ('YAML', *_HASH), 'yml': ('YAML', *_HASH), 'toml': ('TOML', *_HASH), 'cmake': ('CMake', *_HASH),
+    'dockerfile': ('Dockerfile', *_HASH), 'makefile': ('make', *_HASH), 'mk': ('make', *_HASH),
+    'lua': ('Lua', (b'--',), ((b'--[[', b']]'),)), 'sql': ('SQL', (b'--',), ((b'/*', b'*/'),)),
+    'hs': ('Haskell', (b'--',), ((b'{-', b'-}'),)), 'elm': ('Elm', (b'--',), ((b'{-', b'-}'),)),
+    'erl': ('Erlang', (b'%',), ()), 'tex': ('TeX', (b'%',), ()), 'clj': ('Clojure', (b';',), ()),
+    'lisp': ('Lisp', (b';',), ()), 'el': ('Lisp', (b';',), ()), 'asm': ('Assembly', (b';',), ()),
+    'ml': ('OCaml', (), ((b'(*', b'*)'),)), 'fs': ('F#', (b'//',), ((b'(*', b'*)'),)),
+    'vim': ('vim script', (b'"',), ()), 'bat': ('DOS Batch', (b'REM', b'rem', b'::'), ()),
+    'html': ('HTML', (), ((b'<!--', b'-->'),)), 'htm': ('HTML', (), ((b'<!--', b'-->'),)),
+    'xml': ('XML', (), ((b'<!--', b'-->'),)), 'vue': ('Vuejs Component', (b'//',), ((b'<!--', b'-->'),)),
+    'svelte': ('Svelte', (b'//',), ((b'<!--', b'-->'),)), 'md': ('Markdown', (), ()),
+    'json': ('JSON', (), ()), 'ini': ('INI', (b';', b'#'), ()), 'graphql': ('GraphQL', *_HASH),
+}
+
+
+def _find_unclosed_block(line: bytes, start: int, line_comments: tuple[bytes, ...],
+                         blocks: _BlockDelimiters) -> Optional[bytes]:
+    """
+    Find a block comment that is opened on the line at or after `start` and not closed on it.
+
+    :param line: The stripped line
+    :param start: The index to start searching from
+    :param line_comments: The line comment prefixes; nothing after one of them opens a block
+    :param blocks: The block comment delimiters
+    :return: The closer of the block left open, or None if there isn't one
+    """
+    while True:
+        found: tuple[int, bytes, bytes] | None = None
+        for opener, closer in blocks:
+            if (i := line.find(opener, start)) != -1 and (found is None or i < found[0]):
+                found = (i, opener, closer)
+        if found is None:
+            return None
+        i, opener, closer = found
+        # a line comment starting at the same index is the opener itself, as in Lua's --[[ or Julia's #=
+        if any(line.find(prefix, start, i) != -1 for prefix in line_comments):
+            return None
+        if (end := line.find(closer, i + len(opener))) == -1:
+            return closer
+        start = end + len(closer)
+
+
+def _count_loc_in_lines(lines: Iterable[bytes], lang_rules: _LangRules) -> tuple[int, int, int]:
+    """
+    Count the blank, comment and code lines of a single file.
+    Lines holding both code and a comment count as code, like in CLOC.
+
+    :param lines: The raw lines of the file, consumed one at a time
+    :param lang_rules: The comment rules of the file's language
+    :return: A tuple of (blank, comment, code) line counts
+    """
+    _, line_comments, blocks = lang_rules
+    blank: int = 0
+    comment: int = 0
+    code: int = 0
+    open_block_closer: bytes | None = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            blank += 1
+        elif open_block_closer is not None:
+            comment += 1
+            if (end := line.find(open_block_closer)) != -1:
+                open_block_closer = _find_unclosed_block(line, end + len(open_block_closer), line_comments, blocks)
+        elif any(line.startswith(opener) for opener, _ in blocks):  # before line comments, see _find_unclosed_block
+            comment += 1
+            open_block_closer = _find_unclosed_block(line, 0, line_comments, blocks)
+        elif line_comments and line.startswith(line_comments):
+            comment += 1
+        else:
+            code += 1
+            if blocks:  # a block comment can also be opened after code, as in "int y; /* start"
+                open_block_closer = _find_unclosed_block(line, 0, line_comments, blocks)
+    return blank, comment, code
 
+
+class LinesOfCode(commands.Cog):
     def __init__(self, bot: GitBot):
         self.bot: GitBot = bot
+        # bounds only the CPU-bound counting across both loc commands; downloads are limited by max_concurrency,
+        # and each in-flight archive holds at most _4MB_BYTES in memory before spooling to disk
+        self._loc_sem: asyncio.Semaphore = asyncio.Semaphore(max(2, (os.cpu_count() or 1) // 2))
 
     @gitbot_command(name='loc-nocache', aliases=['loc-no-cache'], hidden=True)
     @commands.cooldown(3, 60, commands.BucketType.user)
@@ -67,72 +173,87 @@ class LinesOfCode(commands.Cog):
         )
         await ctx.reply(embed=embed, mention_author=False, view_on_url=r['url'])
 
-    def remove_matches(self, directory: str, pattern: str) -> int:
-        self.bot.logger.debug('Removing files matching pattern "%s" from directory "%s"', pattern, directory)
-        c_removed: int = 0
-        for root, dirs, files in os.walk(directory):
-            for f in files:
-                if fnmatch.fnmatch(f, pattern):
-                    self.bot.logger.debug('Removing file "%s"', f)
-                    c_removed += 1
-                    os.remove(os.path.join(root, f))
-            for d in dirs:
-                if fnmatch.fnmatch(d, pattern):
-                    self.bot.logger.debug('Removing directory "%s"', d)
-                    c_removed += 1
-                    shutil.rmtree(os.path.join(root, d))
-        self.bot.logger.debug('Removed %d entries.', c_removed)
-        return c_removed
+    def _count_loc_sync(self, archive: BinaryIO, exclude: re.Pattern | None = None) -> Optional[tuple[dict, int]]:
+        """
+        Count lines of code in a repository archive without extracting it, mirroring the shape of CLOC's JSON output.
+        Members are streamed line by line; ones over _MAX_FILE_SIZE_BYTES are skipped.
+
+        :param archive: A seekable file object holding the ZIP archive of the repository
+        :param exclude: A compiled pattern matched against every path component of each member
+        :return: A tuple of (CLOC-like result dict, number of excluded entries),
+                 or None if the counted files exceed _MAX_UNCOMPRESSED_SIZE_BYTES
+        """
+        languages: dict[str, dict[str, int]] = {}
+        total: dict[str, int] = {'nFiles': 0, 'blank': 0, 'comment': 0, 'code': 0}
+        with zipfile.ZipFile(archive) as _zip:
+            members: list[zipfile.ZipInfo] = _zip.infolist()
+            c_removed: int = 0
+            if exclude is not None:
+                members, c_removed = self.bot.mgr.filter_zip_members(members, exclude)
+            budget: int = _MAX_UNCOMPRESSED_SIZE_BYTES
+            for member in members:
+                if member.is_dir() or member.file_size > _MAX_FILE_SIZE_BYTES:
+                    continue
+                name: str = member.filename.rsplit('/', 1)[-1].lower()
+                rules: _LangRules | None = (_LANGUAGES_BY_EXTENSION.get(name.rsplit('.', 1)[-1])
+                                            if '.' in name else _LANGUAGES_BY_EXTENSION.get(name))
+                if rules is None:
+                    continue
+                # the extracted size is capped at file_size by zipfile itself, so the header can't understate it
+                if (budget := budget - member.file_size) < 0:
+                    return None
+                with _zip.open(member) as fp:
+                    head: bytes = fp.read(8000)
+                    if b'\0' in head:  # binary file masquerading under a source extension
+                        continue
+                    # finish the line cut off by the sniffed head, then stream the rest
+                    blank, comment, code = _count_loc_in_lines(
+                        itertools.chain((head + fp.readline()).splitlines(), fp), rules)
+                lang: dict[str, int] = languages.setdefault(rules[0], {'nFiles': 0, 'blank': 0, 'comment': 0, 'code': 0})
+                lang['nFiles'] += 1
+                lang['blank'] += blank
+                lang['comment'] += comment
+                lang['code'] += code
+        for lang in languages.values():
+            for k, v in lang.items():
+                total[k] += v
+        output: dict = {'header': {'n_files': total['nFiles'],
+                                   'n_lines': total['blank'] + total['comment'] + total['code']}}
+        output.update(sorted(languages.items(), key=lambda kv: kv[1]['code'], reverse=True))
+        output['SUM'] = total
+        return output, c_removed
 
     async def process_repo(self, ctx: GitBotContext, repo: GitHubRepository) -> Optional[tuple[dict, int | None]]:
         if (not ctx.__nocache__) and (cached := self.bot.mgr.loc_cache.get(repo := repo.lower())):
             return cached
-        tmp_zip_path: str = f'./tmp/{ctx.message.id}.zip'
-        tmp_dir_path: str = tmp_zip_path[:-4]
-        try:
-            if not os.path.exists('./tmp'):
-                os.mkdir('./tmp')
-            files: Optional[bytes | bool] = await self.bot.github.get_repo_zip(repo, size_threshold=_25MB_BYTES)
-            if not files:
+        with tempfile.SpooledTemporaryFile(max_size=_4MB_BYTES) as archive:
+            if not await self.bot.github.get_repo_zip_to_file(repo, archive, size_threshold=_25MB_BYTES):
                 return None
-            async with aiofiles.open(tmp_zip_path, 'wb') as fp:
-                await fp.write(files)
-            await self.bot.mgr.unzip_file(tmp_zip_path, tmp_dir_path)
-            c_removed: int = 0
+            ignore_rx: re.Pattern | None = None
             cfg: dict | None = await self.bot.mgr.get_repo_gitbot_config(repo)
             if cfg and cfg.get('loc'):
                 self.bot.logger.debug('Found GitBot config for repo "%s"', repo)
                 if isinstance(cfg['loc'], dict) and (ignore := cfg['loc'].get('ignore')):
                     if isinstance(ignore, str):
                         ignore = [ignore]
-                    for pattern in ignore:
-                        c_removed += self.remove_matches(tmp_dir_path, pattern)
-            output: dict = json.loads(subprocess.check_output([LinesOfCode.__perl_command_line__, 'cloc.pl',
-                                                               '--json', tmp_dir_path]))
-        except subprocess.CalledProcessError as e:
-            self.bot.logger.error('the CLOC script failed with exit code %d', e.returncode)
-        else:
-            self.bot.mgr.loc_cache[repo] = (output, c_removed)
-            return output, c_removed
-        finally:
+                    ignore_rx = re.compile('|'.join(fnmatch.translate(p) for p in ignore))
             try:
-                shutil.rmtree(tmp_dir_path)
-                os.remove(tmp_zip_path)
-            except FileNotFoundError:
-                pass
+                async with self._loc_sem:
+                    result: Optional[tuple[dict, int]] = await asyncio.to_thread(self._count_loc_sync, archive, ignore_rx)
+            except zipfile.BadZipFile:
+                self.bot.logger.error('Received a malformed zip archive for repo "%s"', repo)
+                return None
+            if result is None:
+                self.bot.logger.debug('Uncompressed size of the archive for repo "%s" is over the limit', repo)
+                return None
+            output, c_removed = result
+        self.bot.mgr.loc_cache[repo] = (output, c_removed)
+        return output, c_removed
 
     @staticmethod
     async def prepare_result_sheet(data: dict) -> str:
-        result: str = '```py\n{}```'
-        threshold: int = 15
-        for k, v in data.items():
-            if threshold == 0:
-                break
-            if k not in ('header', 'SUM'):
-                result: str = result.format(f"{k}: {v['code']}\n{{}}")
-                threshold -= 1
-        result: str = result[:-5] + '```'
-        return result
+        lines: list[str] = [f"{k}: {v['code']}\n" for k, v in data.items() if k not in ('header', 'SUM')][:15]
+        return '```py\n' + ''.join(lines) + '```'
 
 
 async def setup(bot: GitBot) -> None:
@@ -1,4 +1,3 @@
-import re
 import io
 from typing import Optional, TYPE_CHECKING
 from aiohttp import ClientResponse
@@ -9,7 +8,7 @@ if TYPE_CHECKING:
 
 
 async def handle_url(ctx: 'GitBotContext', url: str, **kwargs) -> tuple:
-    match_: tuple = ctx.bot.mgr.opt(re.findall(regex.GITHUB_LINES_URL_RE, url) or re.findall(regex.GITLAB_LINES_URL_RE, url), 0)
+    match_: tuple = ctx.bot.mgr.opt(regex.GITHUB_LINES_URL_RE.findall(url) or regex.GITLAB_LINES_URL_RE.findall(url), 0)
     if match_:
         return await get_text_from_url_and_data(ctx, compile_url(match_), match_, **kwargs)
     return None, ctx.l.snippets.no_lines_mentioned
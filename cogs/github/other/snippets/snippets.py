@@ -1,4 +1,3 @@
-import re
 import discord
 from ._snippet_tools import handle_url, gen_carbon_inmemory  # noqa
 from discord.ext import commands
@@ -26,8 +25,8 @@ class Snippets(commands.Cog):
 
                 await ctx.send(file=discord.File(filename='snippet.png', fp=await gen_carbon_inmemory(ctx, codeblock)))
                 await msg.delete()
-            elif bool(match_ := (re.search(regex.GITHUB_LINES_URL_RE, link_or_codeblock) or
-                                 re.search(regex.GITLAB_LINES_URL_RE, link_or_codeblock))):
+            elif bool(match_ := (regex.GITHUB_LINES_URL_RE.search(link_or_codeblock) or
+                                 regex.GITLAB_LINES_URL_RE.search(link_or_codeblock))):
                 msg: discord.Message = await ctx.info(ctx.l.snippets.generating)
                 text, err = await handle_url(ctx, link_or_codeblock,
                                              max_line_count=self.bot.mgr.env.carbon_len_threshold, wrap_in_codeblock=False)
@@ -46,7 +45,7 @@ class Snippets(commands.Cog):
         ctx.fmt.set_prefix('snippets')
         text, err = await handle_url(ctx, link)
         if text:
-            await ctx.send(text, view=GitHubLinesView(ctx, link))
+            await ctx.send(text, view=GitHubLinesView(ctx, link, text))
         else:
             await ctx.error(err)
 
@@ -1,18 +1,23 @@
 import io
+import asyncio
+import operator
 import discord
-import plotly.express as px
-import plotly.io
-import plotly.graph_objects as go
-import pandas as pd
 from discord.ext import commands
 from lib.utils.decorators import gitbot_group
 from typing import Optional
-from pkg_resources import parse_version
+from packaging.version import Version, InvalidVersion
 from lib.typehints import PyPIProject
 from lib.structs import GitBotEmbed, GitBot
 from lib.structs.discord.context import GitBotContext
 
 
+def _parse_version(tag_name: str) -> Version | None:
+    try:
+        return Version(tag_name)
+    except InvalidVersion:
+        return None
+
+
 class PyPI(commands.Cog):
     def __init__(self, bot: GitBot):
         self.bot: GitBot = bot
@@ -44,6 +49,9 @@ class PyPI(commands.Cog):
         ctx.fmt.set_prefix('pypi info')
         data: Optional[dict] = await self.bot.pypi.get_project_data(project.lower())
         if data:
+            # the author page check is a full HTTP round-trip, so it runs while the rest of the embed is built
+            author_url_task: asyncio.Task = asyncio.create_task(
+                self.bot.mgr.ensure_http_status(f'https://pypi.org/user/{data["info"]["author"]}', alt=''))
             gravatar: str = self.bot.mgr.construct_gravatar_url(data['info']['author_email'],
                                                                 default=self.bot.mgr.i.pip_logo)
             embed: GitBotEmbed = GitBotEmbed(
@@ -56,13 +64,9 @@ class PyPI(commands.Cog):
             if data['info']['summary'] is not None and len(data['info']['summary']) != 0:
                 embed.add_field(name=f":notepad_spiral: {ctx.l.pypi.info.glossary[0]}:",
                                 value=f"```{data['info']['summary'].strip()}```")
-            author: str = ctx.fmt('author', f'[{(author := data["info"]["author"])}]'
-                                            f'({await self.bot.mgr.ensure_http_status(f"https://pypi.org/user/{author}", alt="")})') + '\n'
-
-            first_release = (None, None)
-            for tag_name, release in data['releases'].items():
-                if (v := parse_version(tag_name)) and first_release[0] is None or first_release[0] > v:
-                    first_release = v, release
+            releases: list[tuple[Version, list]] = [(v, release) for tag_name, release in data['releases'].items()
+                                                    if release and (v := _parse_version(tag_name)) is not None]
+            first_release = min(releases, key=operator.itemgetter(0)) if releases else (None, None)
             first_uploaded_at: str = f''
             first_release: tuple[..., list | ...] | list[..., list | ...]
             if first_release[1]:
@@ -71,6 +75,7 @@ class PyPI(commands.Cog):
                                                          first_release[1][0]["upload_time"],
                                                          "%Y-%m-%dT%H:%M:%S")) + '\n'
 
+            author: str = ctx.fmt('author', f'[{data["info"]["author"]}]({await author_url_task})') + '\n'
             requires_python: str = ctx.fmt('requires_python', f'`{data["info"]["requires_python"]}`') + '\n'
             info: str = f'{author}{first_uploaded_at}{requires_python}'
             embed.add_field(name=f":mag_right: {ctx.l.pypi.info.glossary[1]}:", value=info)
@@ -98,17 +103,18 @@ class PyPI(commands.Cog):
     @commands.max_concurrency(7)
     async def project_downloads_command(self, ctx: GitBotContext, project: PyPIProject) -> None:
         ctx.fmt.set_prefix('pypi downloads')
+        # imported lazily - plotly is heavy and only needed by this command
+        import plotly.io
+        import plotly.graph_objects as go
         downloads_overall: Optional[dict] = await self.bot.pypi.get_project_overall_downloads(project)
         if downloads_overall and (data := downloads_overall['data']):
             downloads_recent: dict = (await self.bot.pypi.get_project_recent_downloads(project))['data']
-            df: pd.DataFrame = pd.DataFrame({'date': [item['date'] for item in data],
-                                             'downloads': [item['downloads'] for item in data]})
-            fig: go.Figure = px.line(df,
-                                     x='date',
-                                     y='downloads',
-                                     labels={'date': ctx.l.pypi.downloads.glossary[0],
-                                             'downloads': ctx.l.pypi.downloads.glossary[1]},
-                                     template='plotly_dark')
+            fig: go.Figure = go.Figure(go.Scatter(x=[item['date'] for item in data],
+                                                  y=[item['downloads'] for item in data],
+                                                  mode='lines'))
+            fig.update_layout(template='plotly_dark',
+                              xaxis_title=ctx.l.pypi.downloads.glossary[0],
+                              yaxis_title=ctx.l.pypi.downloads.glossary[1])
             embed: GitBotEmbed = GitBotEmbed(
                     color=self.bot.mgr.c.rounded,
                     title=ctx.fmt('title', project, len(data) - 1),
@@ -119,10 +125,8 @@ class PyPI(commands.Cog):
                     thumbnail=self.bot.mgr.i.pip_logo,
                     footer=ctx.l.pypi.downloads.footer
             )
-            await ctx.reply(embed=embed, file=discord.File(fp=io.BytesIO(plotly.io.to_image(fig,
-                                                                                            format='png',
-                                                                                            engine='kaleido')),
-                                                           filename=f'{project}-downloads-overall.png'),
+            png: bytes = await asyncio.to_thread(plotly.io.to_image, fig, format='png', engine='kaleido')
+            await ctx.reply(embed=embed, file=discord.File(fp=io.BytesIO(png), filename=f'{project}-downloads-overall.png'),
                             mention_author=False, view_on_url=f'https://pypistats.org/packages/{project.replace(".", "-").lower()}')
         else:
             await ctx.error(ctx.l.generic.nonexistent.python_package)
@@ -1,9 +1,6 @@
 import io
+import asyncio
 import discord
-import plotly.express as px
-import plotly.io
-import plotly.graph_objects as go
-import pandas as pd
 from discord.ext import commands
 from lib.utils.decorators import gitbot_group
 from typing import Optional
@@ -99,19 +96,24 @@ class Crates(commands.Cog):
     @commands.max_concurrency(7)
     async def crate_downloads_command(self, ctx: GitBotContext, project: CratesIOCrate) -> None:
         ctx.fmt.set_prefix('crates downloads')
+        # imported lazily - plotly is heavy and only needed by this command
+        import plotly.io
+        import plotly.graph_objects as go
         data: Optional[list] = await self.bot.crates.get_crate_downloads(project)
         if data:
-            df: pd.DataFrame = pd.DataFrame({'date': [item['date'] for item in data],
-                                             'downloads': [item['downloads'] for item in data]})
-            fig: go.Figure = px.line(df,
-                                     x='date',
-                                     y='downloads',
-                                     labels={'date': ctx.l.crates.downloads.glossary[0],
-                                             'downloads': ctx.l.crates.downloads.glossary[1]},
-                                     template='plotly_dark')
+            fig: go.Figure = go.Figure(go.Scatter(x=[item['date'] for item in data],
+                                                  y=[item['downloads'] for item in data],
+                                                  mode='lines'))
+            fig.update_layout(template='plotly_dark',
+                              xaxis_title=ctx.l.crates.downloads.glossary[0],
+                              yaxis_title=ctx.l.crates.downloads.glossary[1])
             yesterday_dl: int = data[-1]['downloads']
-            last_week_dl: int = sum(item['downloads'] for item in data[-7:])
-            last_month_dl: int = sum(item['downloads'] for item in data[-30:])
+            last_week_dl: int = 0
+            last_month_dl: int = 0
+            for i, item in enumerate(reversed(data[-30:])):
+                last_month_dl += item['downloads']
+                if i < 7:
+                    last_week_dl += item['downloads']
             embed: GitBotEmbed = GitBotEmbed(
                     color=self.bot.mgr.c.rounded,
                     title=ctx.fmt('title', project, len(data) - 1),
@@ -122,10 +124,8 @@ class Crates(commands.Cog):
                     thumbnail=self.bot.mgr.i.crates_logo,
                     footer=ctx.l.crates.downloads.footer
             )
-            await ctx.reply(embed=embed, file=discord.File(fp=io.BytesIO(plotly.io.to_image(fig,
-                                                                                            format='png',
-                                                                                            engine='kaleido')),
-                                                           filename=f'{project}-downloads-overall.png'),
+            png: bytes = await asyncio.to_thread(plotly.io.to_image, fig, format='png', engine='kaleido')
+            await ctx.reply(embed=embed, file=discord.File(fp=io.BytesIO(png), filename=f'{project}-downloads-overall.png'),
                             mention_author=False, view_on_url=f'https://crates.io/crates/{project.replace(".", "-").lower()}')
         else:
             await ctx.error(ctx.l.generic.nonexistent.rust_crate)
@@ -6,6 +6,7 @@
 
 
 import aiohttp
+import orjson
 
 BASE_URL_CRATES: str = 'https://crates.io/api/v1'
 
@@ -17,7 +18,7 @@ class CratesIOAPI:
     async def get_crate_data(self, crate: str) -> dict | None:
         res: aiohttp.ClientResponse = await self.ses.get(BASE_URL_CRATES + f'/crates/{crate}')
         if res.status == 200:
-            return await res.json()
+            return orjson.loads(await res.read())
 
     async def keyfetch_or_none(self,
                                endpoint: str,
@@ -25,7 +26,7 @@ class CratesIOAPI:
                                list_index: int | None = None) -> dict | list | str | int | bool | None:
         res: aiohttp.ClientResponse = await self.ses.get(BASE_URL_CRATES + endpoint)
         if res.status == 200:
-            data: dict = await res.json()
+            data: dict = orjson.loads(await res.read())
             try:
                 if isinstance(key, str):
                     data = data[key]
@@ -8,14 +8,19 @@ GitBot backend for interacting with GitHub's API.
 :license: CC BY-NC-ND 4.0, see LICENSE for more details.
 """
 
+import io
+import re
 import aiohttp
 import asyncio
 import functools
+import http
+import orjson
 import inspect
 import gidgethub.aiohttp as gh
 from sys import version_info
-from typing import Optional, Callable, Any, Literal, TYPE_CHECKING, LiteralString
-from gidgethub import BadRequest, QueryError
+from typing import Optional, Callable, Any, Literal, TYPE_CHECKING, LiteralString, BinaryIO
+from gidgethub import (BadRequest, QueryError, RateLimitExceeded, GitHubBroken, GraphQLException,
+                       GraphQLAuthorizationFailure, BadGraphQLRequest, GraphQLResponseTypeError, sansio)
 from datetime import date, datetime
 from lib.structs import DirProxy, TypedCache, CacheSchema, DictProxy, SnakeCaseDictProxy
 from lib.utils.decorators import normalize_repository, validate_github_name
@@ -29,6 +34,8 @@ if TYPE_CHECKING:
 
 YEAR_START: str = f'{date.today().year}-01-01T00:00:30Z'
 DISCORD_UPLOAD_SIZE_THRESHOLD_BYTES: int = int(7.85 * (1024 ** 2))  # 7.85mb
+_ZIP_WRITE_BATCH_BYTES: int = 1024 ** 2  # 1mb
+DEFAULT_RATE_LIMIT: int = 5000  # the hourly core limit of a GitHub token, assumed until the first response comes in
 
 _ReturnDict = SnakeCaseDictProxy | dict
 _GitHubAPIQueryWrapOnFailReturnDefaultNotSet = Literal['default_not_set']
@@ -37,16 +44,66 @@ _GitHubAPIQueryWrapOnFailReturnDefaultConditionDict = dict[str, str | int | bool
 __all__: tuple = ('GitHubAPI', 'GitHubQueryDebugInfo')
 
 
+_GRAPHQL_WHITESPACE_RE: re.Pattern = re.compile(r'\s+')
+_GRAPHQL_PUNCTUATOR_SPACING_RE: re.Pattern = re.compile(r' ?([{}()\[\]:,!=$@|]) ?')
+
+
+def minify_graphql(query: str) -> str:
+    """
+    Collapse insignificant whitespace in a GraphQL document so it's sent to GitHub as compactly as possible.
+    Meant to be run once when queries are loaded, not per request; doesn't handle comments or string literals.
+
+    :param query: The GraphQL document to minify
+    :return: The minified document
+    """
+    return _GRAPHQL_PUNCTUATOR_SPACING_RE.sub(r'\1', _GRAPHQL_WHITESPACE_RE.sub(' ', query)).strip()
+
+
+def _split_repo(repo: str) -> tuple[str, str] | None:
+    """
+    Split an "owner/name" repository string into its parts in one pass.
+
+    :param repo: The repository string
+    :return: An (owner, name) tuple, or None if the string doesn't contain exactly one slash
+    """
+    owner, sep, name = repo.partition('/')
+    return (owner, name) if sep and '/' not in name else None
+
+
 def github_cached(func: Callable) -> Callable:
+    key_prefix: str = func.__qualname__
+
     @functools.wraps(func)
     async def wrapper(*args: tuple, **kwargs: dict) -> Any:
-        cache_key: str = f'{id(func)}:{args[1] if args else next(iter(kwargs))}'
-        if cached := GitHubAPI.github_object_cache.get(cache_key):
-            return cached
-        result: Any = await func(*args, **kwargs)
-        if isinstance(result, (dict, list)):
-            GitHubAPI.github_object_cache[cache_key] = result
-        return result
+        # casefolded like the cache's own keys, so in-flight requests differing only in case are shared too
+        cache_key: str = f'{key_prefix}:{args[1] if len(args) > 1 else next(iter(kwargs.values()))}'.casefold()
+        return await GitHubAPI.github_object_cache.get_or_set(cache_key, lambda: _fetch(cache_key, args, kwargs))
+
+    async def _fetch(cache_key: str, args: tuple, kwargs: dict) -> Any:
+        # single-flight: concurrent callers for the same key wait for the request that's already running
+        while (pending := GitHubAPI.github_inflight_requests.get(cache_key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise  # this caller was cancelled itself
+                # the leading caller was cancelled - take over or wait for whoever already did
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        GitHubAPI.github_inflight_requests[cache_key] = future
+        try:
+            result: Any = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved, the exception is re-raised to the caller below anyway
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            GitHubAPI.github_inflight_requests.pop(cache_key, None)
 
     return wrapper
 
@@ -158,10 +215,52 @@ class GitHubQueryDebugInfo:
         return f'<{self.__class__.__name__} error={self.error} ignorable={self.is_ignorable} code_location="{self.code_location}">'
 
 
+class _OrjsonGidgetHubAPI(gh.GitHubAPI):
+    """
+    gidgethub's aiohttp client with GraphQL bodies encoded and decoded by orjson instead of the stdlib json module.
+    Mirrors :meth:`gidgethub.abc.GitHubAPI.graphql`, error handling included.
+    """
+
+    async def graphql(self, query: str, *, endpoint: str = 'https://api.github.com/graphql', **variables: Any) -> Any:
+        payload: dict[str, Any] = {'query': query}
+        if variables:
+            payload['variables'] = variables
+        request_data: bytes = orjson.dumps(payload)
+        request_headers: dict[str, str] = sansio.create_headers(self.requester, accept='application/json; charset=utf-8',
+                                                                oauth_token=self.oauth_token)
+        request_headers.update({'content-type': 'application/json; charset=utf-8',
+                                'content-length': str(len(request_data))})
+        status_code, response_headers, response_data = await self._request('POST', endpoint, request_headers,
+                                                                           request_data)
+        if not response_data:
+            raise GraphQLException('Response contained no data', response_data)
+        resp_content_type: str | None = response_headers.get('content-type')
+        type_, _ = sansio._parse_content_type(resp_content_type)  # noqa, orjson only takes utf-8 which GitHub uses
+        if type_ != 'application/json':
+            raise GraphQLResponseTypeError(resp_content_type, response_data.decode())
+        response: dict[str, Any] = orjson.loads(response_data)
+        if status_code >= 500:
+            raise GitHubBroken(http.HTTPStatus(status_code))
+        elif status_code == 401:
+            raise GraphQLAuthorizationFailure(response)
+        elif status_code >= 400:
+            raise BadGraphQLRequest(http.HTTPStatus(status_code), response)
+        elif status_code == 200:
+            self.rate_limit = sansio.RateLimit.from_http(response_headers)
+            if 'errors' in response:
+                raise QueryError(response)
+            if 'data' in response:
+                return response['data']
+            raise GraphQLException(f"Response did not contain 'errors' or 'data': {response}", response)
+        raise GraphQLException(f'Unexpected HTTP response to GraphQL request: {status_code}', response)
+
+
 class GitHubAPI:
     __base_url__: str = 'https://api.github.com'
     __non_query_methods__: tuple[str, ...] = ('query', '_sanitize_graphql_variables')
     github_object_cache: TypedCache = TypedCache(CacheSchema(key=str, value=(dict, list)), maxsize=64, max_age=450)
+    github_inflight_requests: dict[str, asyncio.Future] = {}
+    queries: DirProxy | None = None  # loaded and minified once, shared by all instances
 
     """
     The main class used to interact with the GitHub API.
@@ -180,9 +279,23 @@ class GitHubAPI:
         self.bot: 'GitBot' = bot
         self.requester: str = requester
         self.__token: str = token
-        self.queries: DirProxy = DirProxy('./resources/queries/', ('.gql', '.graphql'))
+        if GitHubAPI.queries is None:
+            GitHubAPI.queries = DirProxy('./resources/queries/', ('.gql', '.graphql'), preprocess=minify_graphql)
         self.session: aiohttp.ClientSession = session
-        self.gh: gh.GitHubAPI = gh.GitHubAPI(session=self.session, requester=self.requester, oauth_token=self.__token)
+        self.gh: gh.GitHubAPI = _OrjsonGidgetHubAPI(session=self.session, requester=self.requester, oauth_token=self.__token)
+
+    @property
+    def rate_limit_remaining(self) -> int:
+        """
+        The number of requests this token has left, as reported by the last response.
+        -1 is returned while the token is exhausted and its reset time hasn't passed yet.
+        """
+        rate_limit = self.gh.rate_limit
+        if rate_limit is None:
+            return DEFAULT_RATE_LIMIT
+        if rate_limit.remaining > 0:
+            return rate_limit.remaining
+        return rate_limit.limit if rate_limit else -1  # RateLimit is truthy again once the reset time has passed
 
     @staticmethod
     def _sanitize_graphql_variables(variables: dict[str, ...]) -> dict[str, ...]:
@@ -194,7 +307,7 @@ class GitHubAPI:
         """
         if repo := variables.get(
                 '_Repo'):  # _Repo is a special variable that is used to pass the repo name and owner at once
-            variables['Owner'], variables['Name'] = repo.split('/') if repo.count('/') == 1 else (repo, repo)
+            variables['Owner'], variables['Name'] = _split_repo(repo) or (repo, repo)
             del variables['_Repo']
         return variables
 
@@ -229,6 +342,8 @@ class GitHubAPI:
             return transformer(q_res) if callable(transformer) else q_res
         except (QueryError, BadRequest) as e:
             e: BadRequest | QueryError  # idk why pycharm doesn't pick the types up on its own
+            if isinstance(e, RateLimitExceeded):  # gidgethub raises before storing the limit on the instance
+                self.gh.rate_limit = e.rate_limit
             # below we get the frame of the function from this class that this very function was called from.
             # we cannot simply get the last one or anything, because of decorators getting in the way.
             # we make some expensive calls here, but it's fine because this is only called on errors
@@ -284,7 +399,7 @@ class GitHubAPI:
     @normalize_repository
     async def get_tree_file(self, repo: GitHubRepository, path: str | None = None,
                             ref: str | None = None) -> _ReturnDict | list[_ReturnDict] | None:
-        if repo.count('/') != 1:
+        if _split_repo(repo) is None:
             return None
         if path:
             if path[0] != '/':
@@ -353,19 +468,53 @@ class GitHubAPI:
     @normalize_repository
     async def get_repo_zip(self,
                            repo: GitHubRepository,
-                           size_threshold: int = DISCORD_UPLOAD_SIZE_THRESHOLD_BYTES) -> Optional[bool | bytes]:
-        if '/' not in repo or repo.count('/') > 1:
+                           size_threshold: int = DISCORD_UPLOAD_SIZE_THRESHOLD_BYTES) -> Optional[bool | io.BytesIO]:
+        buffer: io.BytesIO = io.BytesIO()
+        if not (res := await self.get_repo_zip_to_file(repo, buffer, size_threshold=size_threshold)):
+            return res
+        return buffer
+
+    @normalize_repository
+    async def get_repo_zip_to_file(self,
+                                   repo: GitHubRepository,
+                                   fp: BinaryIO,
+                                   size_threshold: int = DISCORD_UPLOAD_SIZE_THRESHOLD_BYTES) -> Optional[bool]:
+        """
+        Stream a repository's zipball into a writable binary file object in fixed-size chunks.
+
+        :param repo: The repository to download
+        :param fp: The file object to write the archive to; rewound to the start on success
+        :param size_threshold: The max size of the archive in bytes
+        :return: True on success, False if the archive exceeds the size threshold, None if it couldn't be fetched
+        """
+        if _split_repo(repo) is None:
             return None
-        res = await self.session.get(self.__base_url__ + f'/repos/{repo}/zipball',
-                                     headers={'Authorization': f'token {self.__token}'})
-        if res.status == 200:
-            try:
-                await res.content.readexactly(size_threshold)
-            except asyncio.IncompleteReadError as read:
-                return read.partial
-            else:
-                return False
-        return None
+        async with self.session.get(self.__base_url__ + f'/repos/{repo}/zipball',
+                                    headers={'Authorization': f'token {self.__token}'}) as res:
+            if res.status != 200:
+                return None
+            total: int = 0
+            pending: list[bytes] = []
+            pending_size: int = 0
+            in_memory: bool = isinstance(fp, io.BytesIO)
+            async for chunk in res.content.iter_chunked(64 * 1024):
+                total += len(chunk)
+                if total > size_threshold:
+                    return False
+                if in_memory:  # nothing to offload
+                    fp.write(chunk)
+                    continue
+                pending.append(chunk)
+                pending_size += len(chunk)
+                # fp may be a file on disk (e.g. a rolled-over SpooledTemporaryFile), so writes are batched off the loop
+                if pending_size >= _ZIP_WRITE_BATCH_BYTES:
+                    await asyncio.to_thread(fp.write, b''.join(pending))
+                    pending.clear()
+                    pending_size = 0
+        if pending:
+            await asyncio.to_thread(fp.write, b''.join(pending))
+        fp.seek(0)
+        return True
 
     @_wrap_proxy
     @normalize_repository
@@ -7,23 +7,25 @@ from lib.structs import (DictProxy, SnakeCaseDictProxy, CaseInsensitiveSnakeCase
 __all__: tuple = ('transform_pull_request', 'transform_repo', 'transform_latest_release', 'transform_user', 'transform_issue')
 _Transformable = TypeVar('_Transformable', DictProxy, SnakeCaseDictProxy, CaseInsensitiveSnakeCaseDict,
                          CaseInsensitiveDict, CaseInsensitiveFixedSizeOrderedDict, dict)
+_PULL_REQUEST_REBUILT_KEYS: frozenset[str] = frozenset({'labels', 'assignees', 'reviewRequests', 'participants'})
+_ISSUE_REBUILT_KEYS: frozenset[str] = frozenset({'bodyText', 'labels'})
 
 
 def transform_pull_request(pull_request_dict: _Transformable) -> _Transformable:
     pull_request_dict: dict = pull_request_dict['repository'][
         'pullRequest'] if 'repository' in pull_request_dict else pull_request_dict
-    pull_request_dict['labels']: list = [lb['node']['name'] for lb in pull_request_dict['labels']['edges']]
-    pull_request_dict['assignees']['users'] = [(u['node']['login'], u['node']['url']) for u in
-                                               pull_request_dict['assignees']['edges']]
-    pull_request_dict['reviewers'] = {}
-    pull_request_dict['reviewers']['users'] = [
-        (o['node']['requestedReviewer']['login'] if 'login' in o['node']['requestedReviewer'] else
-         o['node']['requestedReviewer']['name'], o['node']['requestedReviewer']['url']) for o
-        in pull_request_dict['reviewRequests']['edges']]
-    pull_request_dict['reviewers']['totalCount'] = pull_request_dict['reviewRequests']['totalCount']
-    pull_request_dict['participants']['users'] = [(u['node']['login'], u['node']['url']) for u in
-                                                  pull_request_dict['participants']['edges']]
-    return pull_request_dict
+    return {**{k: v for k, v in pull_request_dict.items() if k not in _PULL_REQUEST_REBUILT_KEYS},
+            'labels': [lb['node']['name'] for lb in pull_request_dict['labels']['edges']],
+            'assignees': {'totalCount': pull_request_dict['assignees']['totalCount'],
+                          'users': [(u['node']['login'], u['node']['url']) for u in
+                                    pull_request_dict['assignees']['edges']]},
+            'reviewers': {'totalCount': pull_request_dict['reviewRequests']['totalCount'],
+                          'users': [(o['node']['requestedReviewer']['login'] if 'login' in o['node']['requestedReviewer']
+                                     else o['node']['requestedReviewer']['name'], o['node']['requestedReviewer']['url'])
+                                    for o in pull_request_dict['reviewRequests']['edges']]},
+            'participants': {'totalCount': pull_request_dict['participants']['totalCount'],
+                             'users': [(u['node']['login'], u['node']['url']) for u in
+                                       pull_request_dict['participants']['edges']]}}
 
 
 def transform_repo(repo_dict: _Transformable) -> _Transformable:
@@ -58,7 +60,6 @@ def transform_user(user_dict: _Transformable) -> _Transformable:
 def transform_issue(issue_dict: _Transformable, had_keys_removed: bool = False) -> _Transformable:
     if not had_keys_removed:
         issue_dict: dict = issue_dict['repository']['issue']
-    issue_dict['body']: str = issue_dict['bodyText']
-    del issue_dict['bodyText']
-    issue_dict['labels']: list = [lb['name'] for lb in list(issue_dict['labels']['nodes'])]
-    return issue_dict
+    return {**{k: v for k, v in issue_dict.items() if k not in _ISSUE_REBUILT_KEYS},
+            'body': issue_dict['bodyText'],
+            'labels': [lb['name'] for lb in issue_dict['labels']['nodes']]}
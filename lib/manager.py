@@ -14,6 +14,7 @@ import re
 import os
 import ast
 import json
+import orjson
 import string
 import dotenv
 import base64
@@ -86,7 +87,7 @@ class Manager:
         self.carbon_attachment_cache: SelfHashingCache = SelfHashingCache(max_age=60 * 60)
         self.autoconv_cache: TypedCache = TypedCache(CacheSchema(key=int, value=dict))
         self.locale_cache: TypedCache = TypedCache(CacheSchema(key=int, value=str), maxsize=256)
-        self.loc_cache: TypedCache = TypedCache(CacheSchema(key=str, value=(dict, tuple)), maxsize=64, max_age=60 * 7)
+        self.loc_cache: TypedCache = TypedCache(CacheSchema(key=str, value=(dict, tuple)), maxsize=256, max_age=60 * 60)
         self.locale.master = getattr(self.l, str(self.locale.master))
         self.db.users = UserCollection(self.db.users, self.git, self)
         self._missing_locale_keys: dict = {l_['name']: [] for l_ in self.locale['languages']}
@@ -101,7 +102,7 @@ class Manager:
         if not gh_res:
             return
         if gh_res['encoding'] == 'base64':
-            return json.loads(base64.decodebytes(bytes(gh_res['content'].encode('utf-8'))).decode('utf-8'))
+            return orjson.loads(base64.decodebytes(gh_res['content'].encode('utf-8')))
 
     def get_current_commit(self, short: bool = True) -> str:
         """
@@ -698,19 +699,27 @@ class Manager:
             return match_.group('content').rstrip('\n')
         self.bot.logger.debug("Couldn't match codeblock")
 
-    async def unzip_file(self, zip_path: str, output_dir: str) -> None:
-        """
-        Unzip a ZIP file to a specified location
-
-        :param zip_path: The location of the ZIP file
-        :param output_dir: The output directory to extract ZIP file contents to
-        """
-        if not os.path.exists(output_dir):
-            self.bot.logger.debug('Creating output directory "%s"', output_dir)
-            os.mkdir(output_dir)
-        with zipfile.ZipFile(zip_path) as _zip:
-            self.bot.logger.debug('Extracting zip archive "%s"', zip_path)
-            _zip.extractall(output_dir)
+    @staticmethod
+    def filter_zip_members(members: Iterable[zipfile.ZipInfo],
+                           exclude: re.Pattern) -> tuple[list[zipfile.ZipInfo], int]:
+        """
+        Filter out ZIP members with any path component matching `exclude`.
+
+        :param members: The members to filter
+        :param exclude: A compiled pattern matched against every path component of each member
+        :return: A tuple of (kept members, number of top-most excluded entries)
+        """
+        kept: list[zipfile.ZipInfo] = []
+        excluded: set[str] = set()
+        for member in members:
+            parts: list[str] = member.filename.rstrip('/').split('/')
+            for i, part in enumerate(parts):
+                if exclude.match(part):
+                    excluded.add('/'.join(parts[:i + 1]))
+                    break
+            else:
+                kept.append(member)
+        return kept, len(excluded)
 
     def get_license(self, to_match: str) -> Optional[DictProxy]:
         """
@@ -1,4 +1,6 @@
+from time import time
 from typing import Optional, Any
+from collections import OrderedDict
 from ..dicts.max_age_dict import CaseInsensitiveMaxAgeDict
 from ..dicts.fixed_size_ordered_dict import CaseInsensitiveFixedSizeOrderedDict
 
@@ -10,7 +12,7 @@ class BaseCache(CaseInsensitiveMaxAgeDict, CaseInsensitiveFixedSizeOrderedDict):
     The base class that nearly all cache structures should inherit from.
     Operations on this special instance of :class:`dict` are case-insensitive.
 
-    :param maxsize: The max number of keys to hold in the cache, delete the oldest one upon setting a new one if full
+    :param maxsize: The max number of keys to hold in the cache, delete the least recently used one upon setting a new one if full
     :param max_age: The time to store cache keys for in seconds
     """
 
@@ -19,8 +21,28 @@ class BaseCache(CaseInsensitiveMaxAgeDict, CaseInsensitiveFixedSizeOrderedDict):
         CaseInsensitiveMaxAgeDict.__init__(self, max_age=max_age)
 
     def __setitem__(self, key: Any, value: Any) -> Any:
-        CaseInsensitiveMaxAgeDict.__setitem__(self, key, value)
-        return CaseInsensitiveFixedSizeOrderedDict._pop(self)
+        # writes must go through OrderedDict, otherwise its internal ordering is never populated and nothing is evicted
+        key = self._casefold(key)
+        self._age_map[key] = int(time())
+        OrderedDict.__setitem__(self, key, value)
+        OrderedDict.move_to_end(self, key)  # overwriting a key counts as using it
+        if len(self) > self.maxsize:  # evict the least recently used key
+            popped: tuple[Any, Any] = OrderedDict.popitem(self, last=False)
+            self._age_map.pop(popped[0], None)
+            return popped
 
     def __getitem__(self, key: Any) -> Any:
-        return CaseInsensitiveMaxAgeDict.__getitem__(self, key)
+        value: Any = CaseInsensitiveMaxAgeDict.__getitem__(self, key)
+        OrderedDict.move_to_end(self, self._casefold(key))
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return BaseCache.__getitem__(self, key)  # not self[key], subclasses implement __getitem__ through get
+        except KeyError:
+            return default
+
+    def __delitem__(self, key: Any) -> None:
+        key = self._casefold(key)
+        self._age_map.pop(key, None)
+        OrderedDict.__delitem__(self, key)
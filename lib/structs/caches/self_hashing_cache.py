@@ -10,7 +10,7 @@ class SelfHashingCache(BaseCache):
     """
     A simple cache structure that automatically hashes keys.
 
-    :param maxsize: The max number of keys to hold in the cache, delete the oldest one upon setting a new one if full
+    :param maxsize: The max number of keys to hold in the cache, delete the least recently used one upon setting a new one if full
     :param max_age: The time to store cache keys for in seconds
     """
 
@@ -1,4 +1,4 @@
-from typing import Any, NoReturn, Optional, Literal
+from typing import Any, NoReturn, Optional, Literal, Callable, Awaitable
 from ..caches.base_cache import BaseCache
 
 __all__: tuple = (
@@ -58,7 +58,7 @@ class TypedCache(BaseCache):
     A simple cache structure that validates __setitem__ actions with a predefined :class:`CacheSchema`.
 
     :param schema: The schema to use for validation
-    :param maxsize: The max number of keys to hold in the cache, delete the oldest one upon setting a new one if full
+    :param maxsize: The max number of keys to hold in the cache, delete the least recently used one upon setting a new one if full
     :param max_age: The time to store cache keys for in seconds
     """
 
@@ -69,3 +69,20 @@ class TypedCache(BaseCache):
     def __setitem__(self, key: Any, value: Any) -> None:
         self.schema(key, value)
         super().__setitem__(key, value)
+
+    async def get_or_set(self, key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get the value of a key, awaiting the factory and caching its result on a miss.
+        Results that don't match the schema's value type are returned without being cached.
+
+        :param key: The cache key
+        :param factory: A callable taking no arguments that returns an awaitable producing the value
+        :return: The cached or newly produced value
+        """
+        key = self._casefold(key)
+        if (cached := self.get(key)) is not None:
+            return cached
+        value: Any = await factory()
+        if isinstance(value, self.schema.value):
+            self[key] = value
+        return value
@@ -1,3 +1,4 @@
+from pymongo import ReturnDocument
 from motor.motor_asyncio import AsyncIOMotorCollection
 from typing import Optional
 from lib.utils.decorators import normalize_identity
@@ -30,14 +31,15 @@ class UserCollection(AsyncIOMotorCollection):
 
     @normalize_identity()
     async def delitem(self, _id: Identity, field: str) -> bool:
-        query: dict = await self.find_one({"_id": _id})
-        if query is not None and field in query:
-            await self.update_one(query, {"$unset": {field: ""}})
-            del query[field]
-            if len(query) == 1:
-                await self.find_one_and_delete({"_id": _id})
-            return True
-        return False
+        doc: dict | None = await self.find_one_and_update({'_id': _id, field: {'$exists': True}},
+                                                          {'$unset': {field: ''}},
+                                                          return_document=ReturnDocument.AFTER)
+        if doc is None:
+            return False
+        if len(doc) == 1:
+            # only delete if the document is still just an _id, in case a field was set in the meantime
+            await self.delete_one({'_id': _id, '$expr': {'$eq': [{'$size': {'$objectToArray': '$$ROOT'}}, 1]}})
+        return True
 
     @normalize_identity()
     async def getitem(self, _id: Identity, item: str) -> Optional[str]:
@@ -54,10 +56,6 @@ class UserCollection(AsyncIOMotorCollection):
         elif item == 'locale':
             valid: bool = any(l_['name'] == value for l_ in self._mgr.locale.languages)
         if valid:
-            query = await self.find_one({"_id": _id})
-            if query is not None:
-                await self.update_one(query, {"$set": {item: value}})
-            else:
-                await self.insert_one({"_id": _id, item: value})
+            await self.update_one({'_id': _id}, {'$set': {item: value}}, upsert=True)
             return True
         return False
@@ -48,8 +48,8 @@ class MaxAgeDict(dict):
         raise KeyError
 
     def __delitem__(self, key: Any) -> None:
-        del self._age_map[key]
-        del self[key]
+        self._age_map.pop(key, None)
+        super().__delitem__(key)
 
 
 class CaseInsensitiveMaxAgeDict(CaseInsensitiveDict, MaxAgeDict):
@@ -67,7 +67,7 @@ class CaseInsensitiveMaxAgeDict(CaseInsensitiveDict, MaxAgeDict):
         return MaxAgeDict.valid(self, CaseInsensitiveDict._casefold(key), delete=delete)
 
     def age(self, key: Any, default: Any = None) -> Any:
-        MaxAgeDict.age(self, CaseInsensitiveDict._casefold(key), default=default)
+        return MaxAgeDict.age(self, CaseInsensitiveDict._casefold(key), default=default)
 
     def get(self, key: Any, default: Any = None) -> Any:
         return MaxAgeDict.get(self, CaseInsensitiveDict._casefold(key), default=default)
@@ -10,7 +10,7 @@ import discord
 import logging
 import aiohttp
 import platform
-import aiofiles
+import operator
 import itertools
 import sentry_sdk
 from dotenv import load_dotenv
@@ -58,17 +58,6 @@ class GitBot(commands.AutoShardedBot):
         else:
             self.logger.info('Skipping uvloop install.')
 
-    async def _setup_cloc(self) -> None:
-        if not os.path.exists('cloc.pl'):
-            self.logger.info('CLOC script not found, downloading...')
-            res: aiohttp.ClientResponse = await self.session.get(
-                'https://github.com/AlDanial/cloc/releases/download/v1.90/cloc-1.90.pl')
-            async with aiofiles.open('cloc.pl', 'wb') as fp:
-                await fp.write(await res.content.read())
-            self.logger.info('CLOC script downloaded.')
-        else:
-            self.logger.info('CLOC script found, skipping download.')
-
     def _setup_sentry(self) -> None:
         if self.mgr.env.production and (dsn := self.mgr.env.get('sentry_dsn')):
             self.logger.info('Setting up Sentry...')
@@ -88,7 +77,13 @@ class GitBot(commands.AutoShardedBot):
 
     @property
     def github(self) -> GitHubAPI | None:
-        return next(self.__internal_github_instances_cycle) if self._internal_github_instances else None
+        if not self._internal_github_instances:
+            return None
+        # pick the token with the most requests left; the starting point advances on every access,
+        # and since max() keeps the first best candidate, ties are handed out round-robin
+        start: int = self._internal_github_instances.index(next(self.__internal_github_instances_cycle))
+        return max(self._internal_github_instances[start:] + self._internal_github_instances[:start],
+                   key=operator.attrgetter('rate_limit_remaining'))
 
     async def _setup_github(self) -> None:
         self._internal_github_instances: tuple[GitHubAPI, ...] = (
@@ -98,7 +93,10 @@ class GitBot(commands.AutoShardedBot):
         self.__internal_github_instances_cycle: itertools.cycle = itertools.cycle(self._internal_github_instances)
 
     async def _setup_services(self) -> None:
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession(loop=self.loop)
+        # a single pooled session is shared by every API wrapper, so connections (and TLS sessions) get reused
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300,
+                                                               keepalive_timeout=75, enable_cleanup_closed=True)
+        self.session: aiohttp.ClientSession = aiohttp.ClientSession(connector=connector)
         await self._setup_github()
         self.mgr: Manager = Manager(self, self.github)
         self.carbon: Carbon = Carbon(self.session)
@@ -129,15 +127,12 @@ class GitBot(commands.AutoShardedBot):
         self.logger.info('Fetched %i blacklisted users.', len(self.user_id_blacklist))
 
     async def setup_hook(self) -> None:
-        if not os.path.exists('./tmp'):
-            os.mkdir('tmp')
         self._setup_logging()
         await self._setup_services()
         self.logger.setLevel(getattr(logging, self.mgr.env.log_level.upper(), self.mgr.env.log_level))
         self._set_runtime_vars()
         self._setup_sentry()
         self._setup_uvloop()
-        await self._setup_cloc()
         await self.load_cogs()
         self.error_log_channel: discord.TextChannel = await self.fetch_channel(self.mgr.env.error_log_channel_id)
         test_guild_id: int | None = self.mgr.env.get('test_guild_id')
@@ -150,7 +145,6 @@ class GitBot(commands.AutoShardedBot):
     async def close(self) -> None:
         await super().close()
         await self.session.close()
-        await self.github.session.close()
 
     async def on_ready(self) -> None:
         self.logger.info(f'Bot bootstrap time: {perf_counter() - self.__init_start:.3f}s')
@@ -1,6 +1,6 @@
 import re
 import discord
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from lib.utils.regex import GITHUB_LINES_URL_RE, GITLAB_LINES_URL_RE
 from cogs.github.other.snippets._snippet_tools import get_text_from_url_and_data, compile_url
 
@@ -21,27 +21,32 @@ class GitHubLinesView(discord.ui.View):
     __original_url__: str
     __original_l1__: int
     __original_l2__: int | None
+    __original_text__: str | None
 
     """
     View facilitating the viewing of consecutive lines of code from a GitHub line link.
     Meant to only be used in the raw text implementation.
     """
 
-    def __init__(self, ctx: 'GitBotContext', lines_url: str, timeout: int = 180) -> None:
+    def __init__(self, ctx: 'GitBotContext', lines_url: str, original_text: str | None = None, timeout: int = 180) -> None:
         # we use a lot of max(n, 1) calls to clamp linenos and prevent any shenanigans
         super().__init__(timeout=timeout)
         self.ctx = ctx
         self.lines_url: str = lines_url
-        self.parsed: re.Match = (re.search(GITHUB_LINES_URL_RE, self.lines_url) or
-                                 re.search(GITLAB_LINES_URL_RE, self.lines_url))
+        self.parsed: re.Match = (GITHUB_LINES_URL_RE.search(self.lines_url) or
+                                 GITLAB_LINES_URL_RE.search(self.lines_url))
         self.platform: str = self.parsed.group('platform')
         self.l1: int = max(int(self.parsed.group('first_line_number')), 1)
         self.l2: int | None = self.ctx.bot.mgr.opt(self.parsed.groupdict().get('second_line_number'), int) or self.l1
-        self._set_originals()
-        _fmt = ctx.l.views.button.github_lines.view_from_to.format  # save some chars
+        self._set_originals(original_text)
+        # bound once, these are used on every label change
+        self._fmt_view: Callable[..., str] = ctx.l.views.button.github_lines.view.format
+        self._fmt_view_from_to: Callable[..., str] = ctx.l.views.button.github_lines.view_from_to.format
+        self._label_ranges: tuple[tuple[int, int], tuple[int, int] | None] | None = None  # last ranges passed to set_labels
+        _fmt = self._fmt_view_from_to  # save some chars
         _b_l1, _b_l2 = max(self.l1 - 25, 1), max(self.l1 - 1, 1)  # precomp backwards values
         self.add_item(_GitHubLinesButton(forward=False,
-                                        label=_fmt(_b_l1, _b_l2) if _b_l1 != _b_l2 else ctx.l.views.button.github_lines.view.format(1),
+                                        label=_fmt(_b_l1, _b_l2) if _b_l1 != _b_l2 else self._fmt_view(1),
                                         emoji='⬅️', style=discord.ButtonStyle.gray))
         self.add_item(_GitHubLinesButton(forward=True,
                                         label=_fmt(max((self.l2 or self.l1) + 1, 1), max((self.l2 or self.l1) + 25, 1)),
@@ -51,14 +56,32 @@ class GitHubLinesView(discord.ui.View):
         self.revert_b.disabled = True  # revert available only when lines are changed
         self.ctx.bot.logger.debug(f'Instantiated GitHubLinesView with url {self.lines_url} for MID {self.ctx.message.id}')
 
-    def _set_originals(self) -> None:
-        # required by the revert button at children[2]
+    def _set_originals(self, original_text: str | None = None) -> None:
+        # required by the revert button at children[2]; the text is the one the view was first sent with, if known
+        self.__original_text__: str | None = original_text
         self.__original_url__: str = self.lines_url
         self.__original_l1__: int = self.l1
         self.__original_l2__: int | None = self.l2
         self.__original_match__: re.Match = self.parsed
 
+    def anchored_url(self, l1: int, l2: int | None) -> str:
+        """
+        Build the blob URL of the viewed file, anchored at the given lines.
+
+        :param l1: The first line
+        :param l2: The last line, if any
+        :return: The URL with a platform-specific #L anchor
+        """
+        url: str = self.parsed.group(0)
+        url = url[:url.rindex('#L')]
+        if not l2 or l2 == l1:
+            return f'{url}#L{l1}'
+        return f'{url}#L{l1}-L{l2}' if self.platform.lower() == 'github' else f'{url}#L{l1}-{l2}'
+
     def set_labels(self, range_backward: tuple[int, int], range_forward: tuple[int, int] | None) -> None:
+        if (range_backward, range_forward) == self._label_ranges:
+            return  # labels are already up-to-date, no need to format them again
+        self._label_ranges = (range_backward, range_forward)
         self.set_localized_label_for_btn(self.backward_b, range_backward)
         if range_forward is not None:
             self.set_localized_label_for_btn(self.forward_b, range_forward)
@@ -70,13 +93,13 @@ class GitHubLinesView(discord.ui.View):
     def set_localized_label_for_btn(self, button: '_GitHubLinesButton', range_: tuple[int, int]) -> None:
         if range_[0] == range_[1]:
             if not button.forward:
-                button.label = self.ctx.l.views.button.github_lines.view.format(1)
+                button.label = self._fmt_view(1)
             else:
                 # we shouldn't have to worry about self.ctx.lines_total being None here since
                 # range_[0] == range_[1] forward implies that the view has been interacted with at least once
-                button.label = self.ctx.l.views.button.github_lines.view.format(self.ctx.lines_total)
+                button.label = self._fmt_view(self.ctx.lines_total)
         else:
-            button.label = self.ctx.l.views.button.github_lines.view_from_to.format(*range_)
+            button.label = self._fmt_view_from_to(*range_)
 
 
 class _GitHubLinesButton(discord.ui.Button):
@@ -108,18 +131,8 @@ class _GitHubLinesButton(discord.ui.Button):
         ctx.bot.logger.debug(f'Previous lines: p_l1={previous_l1}, p_l2={previous_l2}')
         ctx.bot.logger.debug(
             f'Lines to display: l1={self.view.l1}, l2={self.view.l2} for MID {ctx.message.id}; forward={self.forward}')
-        match self.view.platform:
-            case 'github':
-                if previous_l2 is None:
-                    self.view.lines_url = self.view.lines_url.replace(f'#L{previous_l1}', f'#L{self.view.l1}-L{self.view.l2}')
-                else:
-                    self.view.lines_url = self.view.lines_url.replace(f'L{previous_l1}-L{previous_l2}', f'L{self.view.l1}-L{self.view.l2}')
-            case 'gitlab':
-                if previous_l2 is None:
-                    self.view.lines_url = self.view.lines_url.replace(f'#L{[previous_l1]}', f'#L{self.view.l1}-{self.view.l2}')
-                else:
-                    self.view.lines_url = self.view.lines_url.replace(f'#L{previous_l1}-L{previous_l2}', f'#L{self.view.l1}-L{self.view.l2}')
-        new_match = self.view.parsed.groups()[0:4] + (self.view.l1, self.view.l2)
+        new_match: tuple = self.view.parsed.groups()[:4] + (self.view.l1, self.view.l2)
+        self.view.lines_url = self.view.anchored_url(self.view.l1, self.view.l2)
         new, _ = await get_text_from_url_and_data(ctx, compile_url(new_match), new_match)
         if new:
             l_b, l_f = self.get_next_lines(self.view.l1, self.view.l2, False), self.get_next_lines(self.view.l1, self.view.l2, True, ctx.lines_total)
@@ -156,11 +169,11 @@ class _GitHubLinesBackToOriginalButton(discord.ui.Button):
         await interaction.response.defer()
         self.disabled = True  # disable revert button until lines that are displayed are changed again
         self.view.l1, self.view.l2 = self.view.__original_l1__, self.view.__original_l2__
-        self.view._url = self.view.__original_url__
+        self.view.lines_url = self.view.__original_url__
         self.view.forward_b.disabled = False
         self.view.set_labels(_GitHubLinesButton.get_next_lines(self.view.__original_l1__, self.view.__original_l2__, False),
                              _GitHubLinesButton.get_next_lines(self.view.__original_l1__, self.view.__original_l2__, True))
-        await interaction.message.edit(content=(await get_text_from_url_and_data(
+        await interaction.message.edit(content=self.view.__original_text__ or (await get_text_from_url_and_data(
             self.view.ctx, compile_url(self.view.__original_match__.groups()), self.view.__original_match__.groups()
         ))[0], view=self.view)  # send original lines back
         self.view.ctx.bot.logger.debug(f'Back to original button pressed for MID {self.view.ctx.message.id},'
@@ -1,7 +1,7 @@
 import os
 import json
 from .dict_proxy import DictProxy
-from typing import Any, Optional
+from typing import Any, Optional, Callable
 
 
 class DirProxy:
@@ -14,14 +14,23 @@ class DirProxy:
         A path leading to the directory from which to extract files.
     ext: :class:`Optional[:class:`:class:`str` | :class:`tuple`]`
         The extensions to include when mapping, if None, everything will be included.
+    preprocess: :class:`Optional[Callable[[str], Any]]`
+        A callable applied once to the contents of every non-JSON file when it's loaded.
     """
 
-    def __init__(self, path: str, ext: Optional[str | tuple] = None, exclude: str | tuple = ()):
+    def __init__(self,
+                 path: str,
+                 ext: Optional[str | tuple] = None,
+                 exclude: str | tuple = (),
+                 preprocess: Optional[Callable[[str], Any]] = None):
         self.__items: list = []
         for file in (os.listdir(dir_ := os.path.join(os.getcwd(), path))):
             if file not in exclude and (ext is None or file.endswith(ext)):
                 with open(os.path.join(dir_, file), 'r', encoding='utf8') as fp:
-                    content: DictProxy | str = DictProxy(json.load(fp)) if file.endswith('.json') else fp.read()
+                    if file.endswith('.json'):
+                        content: DictProxy | Any = DictProxy(json.load(fp))
+                    else:
+                        content: str | Any = preprocess(fp.read()) if preprocess else fp.read()
                     self.__items.append(content)
                     setattr(self, file[:file.index('.')], content)
 
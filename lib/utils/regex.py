@@ -1,5 +1,10 @@
 import re
 
+try:
+    import re2 as _lines_re  # linear-time matching for the line URL patterns, which are run against every message
+except ImportError:
+    _lines_re = re
+
 # For URLs, use "(?:https?://)?" for protocol prefixes since we don't really care about them
 
 HELP_PARAMETER_REGEX = re.compile(r'(?P<param_type>[\[<])(?P<param_name>[a-zA-Z-_]+)[]>]')
@@ -19,7 +24,7 @@ GITHUB_PULL_REQUESTS_PLAIN_URL_RE: re.Pattern = re.compile(r'(?:https?://)?githu
 GITHUB_ISSUE_URL_RE: re.Pattern = re.compile(r'(?:https?://)?github\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/issues/(?P<number>\d+)', re.IGNORECASE)
 GITHUB_ISSUES_PLAIN_URL_RE: re.Pattern = re.compile(r'(?:https?://)?github\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/issues', re.IGNORECASE)
 GITHUB_REPO_GIT_URL_RE: re.Pattern = re.compile(r'(?:https?://)?github\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)\.git', re.IGNORECASE)
-GITHUB_LINES_URL_RE: re.Pattern = re.compile(r'(?:https?://)?(?P<platform>github)\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/blob/(.+?)/(.+?)#L(?P<first_line_number>\d+)[-~]?L?(?P<second_line_number>\d*)', re.IGNORECASE)
-GITLAB_LINES_URL_RE: re.Pattern = re.compile(r'(?:https?://)?(?P<platform>gitlab)\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/-/blob/(.+?)/(.+?)#L(?P<first_line_number>\d+)-?(?P<second_line_number>\d*)', re.IGNORECASE)
+GITHUB_LINES_URL_RE: re.Pattern = _lines_re.compile(r'(?i)(?:https?://)?(?P<platform>github)\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/blob/(.+?)/(.+?)#L(?P<first_line_number>\d+)[-~]?L?(?P<second_line_number>\d*)')
+GITLAB_LINES_URL_RE: re.Pattern = _lines_re.compile(r'(?i)(?:https?://)?(?P<platform>gitlab)\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/-/blob/(.+?)/(.+?)#L(?P<first_line_number>\d+)-?(?P<second_line_number>\d*)')
 GITHUB_COMMIT_URL_RE: re.Pattern = re.compile(r'(?:https?://)?github\.com/(?P<repo>[a-zA-Z0-9-_]+/[A-Za-z0-9_.-]+)/commit/(?P<oid>\b([a-f0-9]{40})\b)')
 GITHUB_REPO_TREE_RE: re.Pattern = re.compile(r'(?:https?://)?github\.com/(?P<repo>[\w-]+/[\w-]+)/tree/(?P<ref>[\w-]+)/(?P<path>[\w/-]+)')
\ No newline at end of file
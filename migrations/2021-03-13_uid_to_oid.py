@@ -11,15 +11,28 @@ load_dotenv()
 
 db: MongoClient = MongoClient(getenv('DB_CONNECTION'))['store']['users']
 
+BATCH_SIZE: int = 1000
+
 ops: list = []
+written: int = 0
+
+
+def flush() -> None:
+    global written
+    print("Writing " + str(len(ops)))
+    db.bulk_write(ops, ordered=False)
+    written += len(ops)
+    ops.clear()
+
 
-for u in db.find():
-    if 'user_id' in u:
-        uid: int = u['user_id']
-        del u['_id'], u['user_id']
-        ops.append(DeleteOne({'user_id': uid}))
-        ops.append(InsertOne(dict(_id=uid, **u)))
+for u in db.find({'user_id': {'$exists': True}}, batch_size=BATCH_SIZE):
+    uid: int = u['user_id']
+    del u['_id'], u['user_id']
+    ops.append(DeleteOne({'user_id': uid}))
+    ops.append(InsertOne(dict(_id=uid, **u)))
+    if len(ops) >= BATCH_SIZE * 2:
+        flush()
 
-print("Writing " + str(len(ops)))
-db.bulk_write(ops, ordered=False)
-print("Updated " + str(len(ops) >> 1))
+if ops:
+    flush()
+print("Updated " + str(written >> 1))
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+from lib.structs.caches.base_cache import BaseCache
+from lib.structs.caches.typedcache import TypedCache, CacheSchema
+
+
+class BaseCacheEvictionTest(unittest.TestCase):
+    def test_holds_maxsize_entries(self):
+        cache: BaseCache = BaseCache(maxsize=3)
+        for key in ('a', 'b', 'c'):
+            cache[key] = key
+        self.assertEqual(list(cache), ['a', 'b', 'c'])
+        cache['d'] = 'd'
+        self.assertEqual(list(cache), ['b', 'c', 'd'])
+
+    def test_maxsize_one(self):
+        cache: BaseCache = BaseCache(maxsize=1)
+        cache['a'] = 1
+        self.assertEqual(cache.get('a'), 1)
+        cache['b'] = 2
+        self.assertEqual(list(cache), ['b'])
+
+    def test_evicts_least_recently_used(self):
+        cache: BaseCache = BaseCache(maxsize=3)
+        for key in ('a', 'b', 'c'):
+            cache[key] = key
+        cache.get('a')  # a hit
+        cache['b'] = 'B'  # an overwrite
+        cache['d'] = 'd'
+        self.assertEqual(list(cache), ['a', 'b', 'd'])
+        self.assertEqual(cache['b'], 'B')
+
+    def test_case_insensitive(self):
+        cache: BaseCache = BaseCache(maxsize=2)
+        cache['Key'] = 1
+        cache['KEY'] = 2
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache['key'], 2)
+
+
+class BaseCacheExpiryTest(unittest.TestCase):
+    def setUp(self):
+        self.now: int = 1000
+        for target in ('lib.structs.caches.base_cache.time', 'lib.structs.dicts.max_age_dict.time'):
+            patcher = mock.patch(target, lambda: self.now)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_expired_keys_are_dropped(self):
+        cache: BaseCache = BaseCache(maxsize=3, max_age=10)
+        cache['a'] = 1
+        self.now += 5
+        self.assertEqual(cache.get('a'), 1)
+        self.now += 10
+        self.assertIsNone(cache.get('a'))
+        self.assertNotIn('a', cache)
+        with self.assertRaises(KeyError):
+            cache['a']  # noqa
+
+    def test_overwrite_refreshes_age(self):
+        cache: BaseCache = BaseCache(maxsize=3, max_age=10)
+        cache['a'] = 1
+        self.now += 8
+        cache['a'] = 2
+        self.now += 8
+        self.assertEqual(cache.get('a'), 2)
+
+
+class TypedCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_or_set(self):
+        cache: TypedCache = TypedCache(CacheSchema(key=str, value=dict), maxsize=2)
+        calls: list[str] = []
+
+        async def factory() -> dict:
+            calls.append('called')
+            return {'value': 1}
+
+        self.assertEqual(await cache.get_or_set('A', factory), {'value': 1})
+        self.assertEqual(await cache.get_or_set('a', factory), {'value': 1})
+        self.assertEqual(len(calls), 1)
+
+    async def test_get_or_set_skips_values_outside_schema(self):
+        cache: TypedCache = TypedCache(CacheSchema(key=str, value=dict), maxsize=2)
+
+        async def factory() -> None:
+            return None
+
+        self.assertIsNone(await cache.get_or_set('a', factory))
+        self.assertNotIn('a', cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
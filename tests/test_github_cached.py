@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from lib.api.github.github import GitHubAPI, github_cached
+
+
+class _FakeAPI:
+    def __init__(self):
+        self.calls: int = 0
+        self.release: asyncio.Event = asyncio.Event()
+        self.error: Exception | None = None
+
+    @github_cached
+    async def get_thing(self, name: str) -> dict:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {'name': name}
+
+
+class GitHubCachedTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        GitHubAPI.github_object_cache.clear()
+        GitHubAPI.github_object_cache._age_map.clear()
+        GitHubAPI.github_inflight_requests.clear()
+        self.api: _FakeAPI = _FakeAPI()
+
+    async def test_concurrent_callers_share_one_request(self):
+        tasks: list[asyncio.Task] = [asyncio.create_task(self.api.get_thing('Repo')),
+                                     asyncio.create_task(self.api.get_thing('repo'))]
+        await asyncio.sleep(0)
+        self.api.release.set()
+        self.assertEqual(await asyncio.gather(*tasks), [{'name': 'Repo'}, {'name': 'Repo'}])
+        self.assertEqual(self.api.calls, 1)
+        self.assertEqual(await self.api.get_thing('REPO'), {'name': 'Repo'})  # served from the cache
+        self.assertEqual(self.api.calls, 1)
+
+    async def test_leader_error_reaches_every_caller(self):
+        self.api.error = ValueError('boom')
+        tasks: list[asyncio.Task] = [asyncio.create_task(self.api.get_thing('repo')) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.api.release.set()
+        results: list = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.api.calls, 1)
+        self.assertEqual(GitHubAPI.github_inflight_requests, {})
+
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        leader: asyncio.Task = asyncio.create_task(self.api.get_thing('repo'))
+        await asyncio.sleep(0)
+        waiter: asyncio.Task = asyncio.create_task(self.api.get_thing('repo'))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        self.api.release.set()
+        self.assertEqual(await waiter, {'name': 'repo'})
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(self.api.calls, 2)
+
+    async def test_cancelled_waiter_does_not_affect_leader(self):
+        leader: asyncio.Task = asyncio.create_task(self.api.get_thing('repo'))
+        await asyncio.sleep(0)
+        waiter: asyncio.Task = asyncio.create_task(self.api.get_thing('repo'))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.api.release.set()
+        self.assertEqual(await leader, {'name': 'repo'})
+        self.assertEqual(self.api.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
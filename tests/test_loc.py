@@ -0,0 +1,73 @@
+import io
+import types
+import zipfile
+import unittest
+from unittest import mock
+from cogs.github.other.loc import LinesOfCode, _count_loc_in_lines, _LANGUAGES_BY_EXTENSION, _MAX_FILE_SIZE_BYTES
+
+
+def _make_archive(files: dict[str, bytes]) -> io.BytesIO:
+    archive: io.BytesIO = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as _zip:
+        for name, data in files.items():
+            _zip.writestr(name, data)
+    archive.seek(0)
+    return archive
+
+
+class CountLocInLinesTest(unittest.TestCase):
+    def test_lua_block_comment(self):
+        data: bytes = b'--[[\nfirst\nsecond\n]]\nprint("hi")\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['lua']), (0, 4, 1))
+
+    def test_julia_block_comment(self):
+        data: bytes = b'#=\nfirst\nsecond\n=#\nprintln("hi")\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['jl']), (0, 4, 1))
+
+    def test_line_comments_still_counted(self):
+        data: bytes = b'-- a comment\n\nlocal x = 1\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['lua']), (1, 1, 1))
+
+    def test_block_comment_opened_after_code(self):
+        data: bytes = b'int y; /* start\nstill a comment\n*/\nint z; /* closed */\nint w;\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['c']), (0, 2, 3))
+
+    def test_opener_after_line_comment_is_ignored(self):
+        data: bytes = b'int y; // not a /* block\nint z;\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['c']), (0, 0, 2))
+
+    def test_python_docstrings_are_comments(self):
+        data: bytes = b'def f():\n    """\n    Docs.\n    """\n    \'\'\'One-liner.\'\'\'\n    return 1\n'
+        self.assertEqual(_count_loc_in_lines(data.splitlines(), _LANGUAGES_BY_EXTENSION['py']), (0, 4, 2))
+
+
+class CountLocSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.cog: LinesOfCode = LinesOfCode(types.SimpleNamespace())  # noqa, only bot.mgr is used and only to exclude
+
+    def test_highly_compressible_member_is_skipped(self):
+        archive: io.BytesIO = _make_archive({'repo/a.py': b'\n' * (_MAX_FILE_SIZE_BYTES + 1),
+                                             'repo/b.py': b'x = 1\n'})
+        self.assertLess(len(archive.getbuffer()), _MAX_FILE_SIZE_BYTES // 100)
+        output, _ = self.cog._count_loc_sync(archive)
+        self.assertEqual(output['SUM'], {'nFiles': 1, 'blank': 0, 'comment': 0, 'code': 1})
+
+    def test_output_shape(self):
+        archive: io.BytesIO = _make_archive({'repo/': b'', 'repo/a.py': b'# hi\n\nx = 1\n', 'repo/b.c': b'int x;\n',
+                                             'repo/c.c': b'int y;\nint z;\n', 'repo/README': b'text\n'})
+        output, c_removed = self.cog._count_loc_sync(archive)
+        self.assertEqual(c_removed, 0)
+        self.assertEqual(list(output), ['header', 'C', 'Python', 'SUM'])
+        self.assertEqual(output['header'], {'n_files': 3, 'n_lines': 6})
+        self.assertEqual(output['C'], {'nFiles': 2, 'blank': 0, 'comment': 0, 'code': 3})
+        self.assertEqual(output['Python'], {'nFiles': 1, 'blank': 1, 'comment': 1, 'code': 1})
+        self.assertEqual(output['SUM'], {'nFiles': 3, 'blank': 1, 'comment': 1, 'code': 4})
+
+    def test_uncompressed_budget_refuses_archive(self):
+        archive: io.BytesIO = _make_archive({f'repo/{i}.py': b'\n' * 1024 for i in range(4)})
+        with mock.patch('cogs.github.other.loc._MAX_UNCOMPRESSED_SIZE_BYTES', 3 * 1024):
+            self.assertIsNone(self.cog._count_loc_sync(archive))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import re
+import zipfile
+import unittest
+from lib.manager import Manager
+
+
+class FilterZipMembersTest(unittest.TestCase):
+    def test_counts_top_most_excluded_entries(self):
+        members: list[zipfile.ZipInfo] = [zipfile.ZipInfo(name) for name in (
+            'repo/', 'repo/a.py', 'repo/node_modules/', 'repo/node_modules/x/index.js', 'repo/node_modules/y.js',
+            'repo/src/', 'repo/src/b.py', 'repo/src/node_modules/z.js', 'repo/dist.min.js'
+        )]
+        kept, excluded = Manager.filter_zip_members(members, re.compile(r'node_modules|.*\.min\.js'))
+        self.assertEqual([m.filename for m in kept], ['repo/', 'repo/a.py', 'repo/src/', 'repo/src/b.py'])
+        # repo/node_modules, repo/src/node_modules and repo/dist.min.js
+        self.assertEqual(excluded, 3)
+
+    def test_nothing_matching(self):
+        members: list[zipfile.ZipInfo] = [zipfile.ZipInfo('repo/'), zipfile.ZipInfo('repo/a.py')]
+        self.assertEqual(Manager.filter_zip_members(members, re.compile(r'vendor')), (members, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()